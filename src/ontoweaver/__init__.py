@@ -1,4 +1,5 @@
 import logging
+import itertools
 from typing import Tuple
 
 import biocypher
@@ -23,6 +24,10 @@ from . import fuse
 from . import fusion
 from . import exceptions
 
+# Use the libyaml parser if PyYAML was built with it,
+# with the same tag support as yaml.full_load.
+YamlLoader = getattr(yaml, "CFullLoader", yaml.FullLoader)
+
 __all__ = ['Node', 'Edge', 'Transformer', 'Adapter', 'All', 'tabular', 'types', 'transformer', 'serialize', 'congregate', 'merge', 'fuse', 'fusion', 'exceptions']
 
 
@@ -45,6 +50,8 @@ def extract_reconciliate_write(biocypher_config_path, schema_path, filename_to_m
        Returns:
            The path to the import file.
    """
+    # Chain the adapters' generators, so that all the nodes and edges
+    # are not copied in intermediate lists before reconciliation.
     nodes = []
     edges = []
 
@@ -52,17 +59,21 @@ def extract_reconciliate_write(biocypher_config_path, schema_path, filename_to_m
 
         assert(type(filename_to_mapping) == dict) # data_file => mapping_file
 
+        # The same mapping may be used on several data files, parse it only once.
+        mappings = {}
         for data_file, mapping_file in filename_to_mapping.items():
             table = pd.read_csv(data_file)
 
-            with open(mapping_file) as fd:
-                mapping = yaml.full_load(fd)
+            if mapping_file not in mappings:
+                with open(mapping_file) as fd:
+                    mappings[mapping_file] = yaml.load(fd, Loader=YamlLoader)
+            mapping = mappings[mapping_file]
 
             adapter = tabular.extract_table(table, mapping, parallel_mapping=parallel_mapping, affix=affix,
                                             separator=affix_separator)
 
-            nodes += adapter.nodes
-            edges += adapter.edges
+            nodes.append(adapter.nodes)
+            edges.append(adapter.edges)
 
     if dataframe_to_mapping:
 
@@ -73,10 +84,10 @@ def extract_reconciliate_write(biocypher_config_path, schema_path, filename_to_m
             adapter = tabular.extract_table(data_frame, yaml_object, parallel_mapping=parallel_mapping, affix=affix,
                                             separator=affix_separator)
 
-            nodes += adapter.nodes
-            edges += adapter.edges
+            nodes.append(adapter.nodes)
+            edges.append(adapter.edges)
 
-    fnodes, fedges = fusion.reconciliate(nodes, edges, separator = separator)
+    fnodes, fedges = fusion.reconciliate(itertools.chain(*nodes), itertools.chain(*edges), separator = separator)
 
     bc = biocypher.BioCypher(    # fixme change constructor to take contents of paths instead of reading path.
         biocypher_config_path = biocypher_config_path,
@@ -114,11 +125,15 @@ def extract(filename_to_mapping = None, dataframe_to_mapping = None, parallel_ma
 
         assert(type(filename_to_mapping) == dict) # data_file => mapping_file
 
+        # The same mapping may be used on several data files, parse it only once.
+        mappings = {}
         for data_file, mapping_file in filename_to_mapping.items():
             table = pd.read_csv(data_file)
 
-            with open(mapping_file) as fd:
-                mapping = yaml.full_load(fd)
+            if mapping_file not in mappings:
+                with open(mapping_file) as fd:
+                    mappings[mapping_file] = yaml.load(fd, Loader=YamlLoader)
+            mapping = mappings[mapping_file]
 
             adapter = tabular.extract_table(table, mapping, parallel_mapping=parallel_mapping, affix=affix,
                                             separator=affix_separator)
@@ -189,7 +204,7 @@ def validate_input_data(filename_to_mapping: dict):
         table = pd.read_csv(data_file)
 
         with open(mapping_file) as fd:
-            yaml_mapping = yaml.full_load(fd)
+            yaml_mapping = yaml.load(fd, Loader=YamlLoader)
 
         parser = tabular.YamlParser(yaml_mapping, types)
         mapping = parser()
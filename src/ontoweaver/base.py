@@ -1,3 +1,4 @@
+import sys
 import logging
 from collections.abc import Iterable, Generator
 from abc import ABCMeta as ABSTRACT, ABCMeta, abstractmethod
@@ -73,7 +74,8 @@ class Element(metaclass = ABSTRACT):
         self.properties = properties
 
         if not label:
-            self._label = self.__class__.__name__.lower()
+            # Intern the label, so that all the elements of a class share the same string.
+            self._label = sys.intern(self.__class__.__name__.lower())
         else:
             self._label = str(label)
 
@@ -364,11 +366,8 @@ class Adapter(ErrorManager, metaclass = ABSTRACT):
             nodes = node_s
 
         # logging.debug(f"Nodes: {nodes}.")
-        for node in nodes:
-            # logging.debug(f"\tAppend node {node}.")
-            # Checking for duplicates in reconciliation, otherwise complexity too high.
-            self._nodes.append(node.as_tuple())
-            # return True
+        # Checking for duplicates in reconciliation, otherwise complexity too high.
+        self._nodes.extend([node.as_tuple() for node in nodes])
 
     def edges_append(self, edge_s) -> None:
         """Append an Edge (or each Edge in a list of edges) to the internal list of edges."""
@@ -378,23 +377,18 @@ class Adapter(ErrorManager, metaclass = ABSTRACT):
             edges = edge_s
 
         # logging.debug(f"Edges: {edges}.")
-        for edge in edges:
-            # logging.debug(f"\tAppend edge {edge}.")
-            # Checking for duplicates in reconciliation, otherwise complexity too high.
-            self._edges.append(edge.as_tuple())
-            # return True
+        # Checking for duplicates in reconciliation, otherwise complexity too high.
+        self._edges.extend([edge.as_tuple() for edge in edges])
 
     @property
     def nodes(self) -> Iterable[Node.Tuple]:
         """Return a generator yielding nodes."""
-        for n in self._nodes:
-            yield n
+        yield from self._nodes
 
     @property
     def edges(self) -> Iterable[Edge.Tuple]:
         """Return a generator yielding edges."""
-        for e in self._edges:
-            yield e
+        yield from self._edges
 
 
 class Transformer(ErrorManager):
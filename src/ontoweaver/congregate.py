@@ -60,10 +60,15 @@ class Congregate(Congregater):
             biocypher_tuples: a list of tuples in the BioCypher format for nodes xor edges.
         """
         logging.debug(f"Call Congregate...")
+        # Resolve the attributes once, out of the loop.
+        from_tuple = self._elem_cls.from_tuple
+        serializer = self.serializer
+        duplicates = self._duplicates
         for t in biocypher_tuples:
-            elem = self._elem_cls.from_tuple(t, serializer = self.serializer)
-            self._duplicates[elem] = self._duplicates.get(elem, []) + [elem]
-        if __debug__:
+            elem = from_tuple(t, serializer = serializer)
+            # Append in place: hash the element once and do not copy the list of duplicates.
+            duplicates.setdefault(elem, []).append(elem)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
             logging.debug(f"Congregated in {len(self._duplicates)} keys:")
             for k,l in self._duplicates.items():
                 logging.debug(f"  Key `{k}` => {len(l)} elements")
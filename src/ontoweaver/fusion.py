@@ -42,28 +42,37 @@ class Reduce(Fusioner):
         self.fuser = fuser
 
     def __call__(self, congregater: congregate.Congregater) -> set[base.Element]:
+        # The per-element debug messages build strings and intermediate fused elements,
+        # only do it if they are going to be emitted.
+        debug = logging.getLogger().isEnabledFor(logging.DEBUG)
         fusioned = set()
         for key, elem_list in congregater.duplicates.items():
             self.fuser.reset()
-            logging.debug(f"Fusion of {type(congregater).__name__} with {type(congregater.serializer).__name__} for key: `{key}`")
+            if debug:
+                logging.debug(f"Fusion of {type(congregater).__name__} with {type(congregater.serializer).__name__} for key: `{key}`")
             assert(elem_list)
             assert(len(elem_list) > 0)
 
             # Manual functools.reduce without initial state.
             it = iter(elem_list)
             lhs = next(it)
-            logging.debug(f"  Fuse element with ID `{lhs}`...")
-            logging.debug(f"    with itself: {repr(lhs)}")
+            if debug:
+                logging.debug(f"  Fuse element with ID `{lhs}`...")
+                logging.debug(f"    with itself: {repr(lhs)}")
             self.fuser(key, lhs, lhs)
-            logging.debug(f"      = {repr(self.fuser.get())}")
+            if debug:
+                logging.debug(f"      = {repr(self.fuser.get())}")
             for rhs in it:
-                logging.debug(f"    with `{rhs}`: {repr(rhs)}")
+                if debug:
+                    logging.debug(f"    with `{rhs}`: {repr(rhs)}")
                 self.fuser(key, lhs, rhs)
-                logging.debug(f"      = {repr(self.fuser.get())}")
+                if debug:
+                    logging.debug(f"      = {repr(self.fuser.get())}")
 
             # Convert to final string.
             f = self.fuser.get()
-            logging.debug(f"  Fused: {repr(f)}")
+            if debug:
+                logging.debug(f"  Fused: {repr(f)}")
             assert(issubclass(type(f), base.Element))
             fusioned.add(f)
         logging.debug(f"Fusioned {len(fusioned)} elements.")
@@ -79,7 +88,7 @@ def remap_edges(edges, ID_mapping):
     hence the need to remap the corresponding IDs in edges' sources and targets.
 
     Args:
-        edges: a list of Biocypher tuples representing edges
+        edges: an iterable of Biocypher tuples representing edges
         ID_mapping: a dictionary mapping old IDs to new Ids
 
     Returns:
@@ -119,7 +128,7 @@ def reconciliate_nodes(nodes, separator = None):
             - merge.dictry.Append for properties.
 
     Args:
-        nodes: a list of base.Node
+        nodes: an iterable of Biocypher's node tuples, consumed only once
 
     Returns:
         the list of fused nodes and the ID mapping dictionary
@@ -165,7 +174,7 @@ def reconciliate_edges(edges, separator = None):
             - merge.string.UseLast for both id_source and id_target.
 
     Args:
-        edges: a list of base.Edge
+        edges: an iterable of Biocypher's edge tuples, consumed only once
 
     Returns:
         the list of fused edges
@@ -201,15 +210,18 @@ def reconciliate_edges(edges, separator = None):
 
 
 def reconciliate(nodes, edges, separator = None):
-    """Operates a simple fusion on the given lists of elements.
+    """Operates a simple fusion on the given elements.
 
     A "reconciliation" finds nodes with duplicated IDs
     (within source & target for the related edges),
     and merge their properties without losing information.
 
+    Both nodes and edges are iterated only once,
+    so they may be given as generators, avoiding to build intermediate lists.
+
     Args:
-        nodes: a list of Biocypher's node tuples
-        edges: a list of Biocypher's edge tuples
+        nodes: an iterable of Biocypher's node tuples
+        edges: an iterable of Biocypher's edge tuples
 
     Returns:
         the list of fused node tuples and the list of fused edge tuples
@@ -140,13 +140,14 @@ class dictry:
 
         def set(self, merged) -> None:
             assert(type(merged) == dict)
+            # Accumulate values in place, instead of copying
+            # the already merged set at each call.
             for k,v in merged.items():
-                e = self.merged.get(k, set())
+                e = self.merged.setdefault(k, set())
                 if type(v) == set:
-                    e.union(v)
-                    self.merged[k] = e
+                    e.update(v)
                 else:
-                    self.merged[k] = set((v,)).union(e)
+                    e.add(v)
 
         def merge(self, key, lhs: dict[str,str], rhs: dict[str,str]):
             self.set(lhs)
@@ -1,6 +1,7 @@
 import re
 import sys
 import logging
+import functools
 import pandas as pd
 
 from . import base
@@ -38,6 +39,14 @@ def register(transformer_class):
     setattr(current, transformer_class.__name__, transformer_class)
 
 
+@functools.cache
+def _read_csv_args() -> frozenset[str]:
+    """Arguments available to pandas.read_csv, extracted once from its docstring."""
+    return frozenset(line.split(":")[0].strip()
+                     for line in pd.read_csv.__doc__.split("\n")
+                     if re.match(r"^[a-z_]+ :", line))
+
+
 # NOTE: transformers pass all kwargs to superclass to allow it to show
 #       the (additional) user-defined arguments when calling __repr__.
 
@@ -291,13 +300,8 @@ class translate(base.Transformer):
                 self.translate_from = translate_from
                 self.translate_to = translate_to
 
-                # Extract available arguments from Pandas' read_csv docstring:
-                pd_read_csv_args = []
-                for line in pd.read_csv.__doc__.split("\n"):
-                    if re.match(r"^[a-z_]+ :", line):
-                        pd_read_csv_args.append(line.split(":")[0].strip())
-
                 # Keep only the user-passed arguments that are in Pandas' read_csv list.
+                pd_read_csv_args = _read_csv_args()
                 pd_args = {k:v for k,v in kwargs.items() if k in pd_read_csv_args}
 
                 if "sep" in pd_args and pd_args["sep"] == "TAB":
@@ -315,12 +319,13 @@ class translate(base.Transformer):
                 if self.translate_to not in self.df.columns:
                     self.error(f"Target column `{self.translate_to}` not found in {type(self).__name__} transformer’s translations file `{self.translations_file}`, available headers: `{','.join(self.df.columns)}`.", section="translate.init", exception = exceptions.TransformerDataError)
 
+                # Iterate over the two columns only, instead of building a Series for each row.
                 self.translate = {}
-                for i,row in self.df.iterrows():
-                    if row[self.translate_from] and row[self.translate_to]:
-                        self.translate[row[self.translate_from]] = row[self.translate_to]
+                for i,frm,to in zip(self.df.index, self.df[self.translate_from], self.df[self.translate_to]):
+                    if frm and to:
+                        self.translate[frm] = to
                     else:
-                        logging.warning(f"Cannot translate from `{self.translate_from}` to `{self.translate_to}`, invalid translations values at row {i} of file `{self.translations_file}`: `{row[self.translate_from]}` => `{row[self.translate_to]}`. I will ignore this translation.")
+                        logging.warning(f"Cannot translate from `{self.translate_from}` to `{self.translate_to}`, invalid translations values at row {i} of file `{self.translations_file}`: `{frm}` => `{to}`. I will ignore this translation.")
 
         else:
             self.error(f"When using a {type(self).__name__} transformer, you must define either `translations` or `translations_file`.", section="translate.init", exception = exceptions.TransformerInterfaceError)
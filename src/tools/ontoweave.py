@@ -3,6 +3,7 @@
 import os
 import sys
 import logging
+import importlib
 import pathlib
 import platform
 import xdg_base_dirs as xdg
@@ -73,14 +74,23 @@ def import_from_path(file_path):
     return module
 
 
-if __name__ == "__main__":
+def main(argv = None, appname = None):
+    """Run the command line tool.
+
+    Args:
+        argv: the list of command line arguments, without the program name. Defaults to `sys.argv[1:]`.
+        appname: the name of the tool, used to find its configuration files. Defaults to the name of the running script.
+
+    Returns:
+        0 on success, exits with one of the `error_codes` otherwise.
+    """
     import jsonargparse
     import argparse
     import subprocess
-    import importlib
     import inspect
 
-    appname = os.path.splitext(os.path.basename(sys.argv[0]))[0]
+    if not appname:
+        appname = os.path.splitext(os.path.basename(sys.argv[0]))[0]
 
     logger = logging.getLogger(appname)
 
@@ -133,7 +143,7 @@ if __name__ == "__main__":
     do.add_argument("-v", "--validate-only", action="store_true",
                     help="Only validate the given input data, do not apply the mapping.")
 
-    asked = do.parse_args()
+    asked = do.parse_args(argv)
 
     logger.setLevel(asked.log_level)
 
@@ -250,3 +260,9 @@ if __name__ == "__main__":
 
 
     logger.info("Done")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+import pathlib
+
+import pytest
+import pandas as pd
+import biocypher
+
+from . import testing_functions
+
+
+@pytest.fixture(scope="module")
+def output_dir(request, tmp_path_factory):
+    """Temporary directory receiving the BioCypher output of a test module."""
+    return tmp_path_factory.mktemp(request.module.directory_name)
+
+
+@pytest.fixture(scope="module")
+def bc(request, output_dir):
+    """BioCypher instance shared by the tests of a module.
+
+    The configuration files are taken from the `tests/<directory_name>/`
+    directory, where `directory_name` is a module-level variable
+    of the requesting test module.
+    The output files are written in the `output_dir` fixture.
+    """
+    directory = pathlib.Path("tests", request.module.directory_name)
+    return biocypher.BioCypher(
+        biocypher_config_path=str(directory / "biocypher_config.yaml"),
+        schema_config_path=str(directory / "schema_config.yaml"),
+        output_directory=str(output_dir)
+    )
+
+
+@pytest.fixture(scope="session")
+def load_mapping():
+    """Load a mapping file, parsing each file only once per test session.
+
+    The returned mappings are shared between tests and must not be modified.
+    """
+    mappings = {}
+
+    def load(filename):
+        if filename not in mappings:
+            mappings[filename] = testing_functions.load_yaml(filename)
+        return mappings[filename]
+
+    return load
+
+
+@pytest.fixture(scope="session")
+def load_table():
+    """Load a CSV data file, reading each file only once per test session.
+
+    Keyword arguments are passed to `pandas.read_csv`.
+
+    The returned tables are shared between tests and must not be modified.
+    """
+    tables = {}
+
+    def load(filename, **kwargs):
+        key = (filename, tuple(sorted(kwargs.items())))
+        if key not in tables:
+            tables[key] = pd.read_csv(filename, **kwargs)
+        return tables[key]
+
+    return load
@@ -1,12 +1,10 @@
+import yaml
+import pandas as pd
+import biocypher
 
-def main():
-    import yaml
-
-    import pandas as pd
-    import biocypher
-
-    import ontoweaver
+import ontoweaver
 
+def main():
     bc = biocypher.BioCypher(
         biocypher_config_path = "test_2ontologies/biocypher.yaml",
         schema_config_path = "test_2ontologies/schema.yaml"
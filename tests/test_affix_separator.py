@@ -1,31 +1,19 @@
+import logging
+import pathlib
 
-def test_affix_separator():
-    import yaml
-    import logging
-    import pandas as pd
-    import biocypher
-    import shutil
-    from . import testing_functions
+import ontoweaver
+from . import testing_functions
 
-    import ontoweaver
+directory_name = "affix_separator"
+directory = pathlib.Path("tests", directory_name)
 
-    logging.debug("Load ontology...")
-
-    directory_name = "affix_separator"
-
-    bc = biocypher.BioCypher(
-        biocypher_config_path="tests/" + directory_name + "/biocypher_config.yaml",
-        schema_config_path="tests/" + directory_name + "/schema_config.yaml"
-    )
 
+def test_affix_separator(bc, output_dir, load_table, load_mapping):
     logging.debug("Load data...")
-    csv_file = "tests/" + directory_name + "/data.csv"
-    table = pd.read_csv(csv_file)
+    table = load_table(directory / "data.csv", na_filter=False, dtype=str)
 
     logging.debug("Load mapping...")
-    mapping_file = "tests/" + directory_name + "/mapping.yaml"
-    with open(mapping_file) as fd:
-        mapping = yaml.full_load(fd)
+    mapping = load_mapping(directory / "mapping.yaml")
 
     logging.debug("Run the adapter...")
 
@@ -34,24 +22,14 @@ def test_affix_separator():
     assert (adapter)
 
     logging.debug("Write nodes...")
-    assert (adapter.nodes)
     bc.write_nodes(adapter.nodes)
 
     logging.debug("Write edges...")
-    assert (adapter.edges)
     bc.write_edges(adapter.edges)
 
     logging.debug("Write import script...")
     bc.write_import_call()
 
-    output_dir = testing_functions.get_latest_directory("biocypher-out")
-
-    assert_output_path = "tests/" + directory_name + "/assert_output"
+    assert_output_path = directory / "assert_output"
 
     testing_functions.compare_csv_files(assert_output_path, output_dir)
-
-    shutil.rmtree(output_dir)
-
-
-if __name__ == "__main__":
-    test_affix_separator()
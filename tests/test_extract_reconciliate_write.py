@@ -1,31 +1,21 @@
-import yaml
-import logging
-import shutil
-import pandas as pd
-import biocypher
+import pathlib
 
 import ontoweaver
-from . import testing_functions
 
-def test_extract_reconciliate_write():
+directory = pathlib.Path(__file__).resolve().parent / "simplest"
 
-    dir = "tests/simplest/"
+def test_extract_reconciliate_write(tmp_path, monkeypatch):
+
+    # BioCypher writes in `biocypher-out/` under the current directory,
+    # run from a temporary one so as to not race with other tests.
+    monkeypatch.chdir(tmp_path)
 
     import_file = ontoweaver.extract_reconciliate_write(
-        dir+"/biocypher_config.yaml",
-        dir+"/schema_config.yaml",
+        str(directory / "biocypher_config.yaml"),
+        str(directory / "schema_config.yaml"),
         {
-            dir+"data.csv": dir+"mapping.yaml"
+            str(directory / "data.csv"): str(directory / "mapping.yaml")
         }
     )
 
     assert(import_file)
-
-    # output_dir = testing_functions.get_latest_directory("biocypher-out")
-    # assert_output_path = dir + "/assert_output"
-    # testing_functions.compare_csv_files(assert_output_path, output_dir)
-    # shutil.rmtree(output_dir)
-
-if __name__ == "__main__":
-    test_extract_reconciliate_write()
-
@@ -29,7 +29,7 @@ def test_fuse():
 
     logging.debug("Fusioned items:")
     for f in fusioned:
-        logging.debug("  "+repr(f))
+        logging.debug("  %r", f)
 
     assert(len(fusioned) == 2)
     for e in fusioned:
@@ -52,7 +52,7 @@ def test_fuse():
 
     logging.debug("Fusioned items:")
     for f in fusioned2:
-        logging.debug("  "+repr(f))
+        logging.debug("  %r", f)
 
     assert(len(fusioned2) == 2)
     for e in fusioned2:
@@ -1,42 +1,37 @@
 import logging
 
+import pytest
+
 import ontoweaver
 
-def test_append():
+sep = ";"
+
 
-    sep = ";"
+@pytest.mark.parametrize("lhs, rhs, expected", [
+    ({"p1":"x"}, {"p2":"y"}, {"p1":"x", "p2":"y"}),
+    ({"p1":"x"}, {}, {"p1":"x"}),
+    ({"p1":"x", "p2":"y"}, {}, {"p1":"x", "p2":"y"}),
+])
+def test_append(lhs, rhs, expected):
     merge = ontoweaver.merge.dictry.Append(sep)
 
     k = ontoweaver.base.Node()
 
-    merge(k, {"p1":"x"},{"p2":"y"} )
-    assert( merge.get() == {"p1":"x", "p2":"y"} )
-
-    merge.reset()
-    merge(k, {"p1":"x"},{} )
-    assert( merge.get() == {"p1":"x"} )
-
-    merge.reset()
-    merge(k, {"p1":"x", "p2":"y"},{} )
-    assert( merge.get() == {"p1":"x", "p2":"y"} )
+    merge(k, lhs, rhs)
+    assert( merge.get() == expected )
 
-    merge.reset()
-    merge(k, {"p1":"x"},{"p1":"y"} )
-    assert( "y" in merge.get()["p1"].split(sep) )
-    assert( "x" in merge.get()["p1"].split(sep) )
 
-    merge.reset()
-    merge(k, {"p1":"abcd"},{"p1":"efgh"} )
-    m = merge.get()
-    assert( "abcd" in m["p1"].split(sep) )
-    assert( "efgh" in m["p1"].split(sep) )
-
-    merge.reset()
-    merge(k, {"p1":"[abcd]"},{"p1":"[efgh]"} )
-    m = merge.get()
-    assert( "[abcd]" in m["p1"].split(sep) )
-    assert( "[efgh]" in m["p1"].split(sep) )
+@pytest.mark.parametrize("lhs, rhs, values", [
+    ({"p1":"x"}, {"p1":"y"}, {"x", "y"}),
+    ({"p1":"abcd"}, {"p1":"efgh"}, {"abcd", "efgh"}),
+    ({"p1":"[abcd]"}, {"p1":"[efgh]"}, {"[abcd]", "[efgh]"}),
+    ({"p1":{"x", "y"}}, {"p1":"z"}, {"x", "y", "z"}),
+])
+def test_append_same_key(lhs, rhs, values):
+    merge = ontoweaver.merge.dictry.Append(sep)
 
+    k = ontoweaver.base.Node()
 
-if __name__ == "__main__":
-    test_append()
+    merge(k, lhs, rhs)
+    parts = set(merge.get()["p1"].split(sep))
+    assert( values <= parts )
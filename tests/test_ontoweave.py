@@ -1,8 +1,10 @@
-import os
 import logging
+import sys
+import pathlib
 import subprocess
 
 import ontoweaver
+from tools import ontoweave
 
 class user_transformer(ontoweaver.base.Transformer):
     def __init__(self, target, properties_of, edge=None, columns=None, **kwargs):
@@ -13,22 +15,52 @@ class user_transformer(ontoweaver.base.Transformer):
             yield str(row[key])
 
 
-def test_ontoweave():
-    logging.debug(f"From: {os.getcwd()}")
-    cmd="./src/tools/ontoweave --biocypher-config ./tests/simplest/biocypher_config.yaml --biocypher-schema ./tests/simplest/schema_config.yaml --type-affix suffix --type-affix-sep : --prop-sep ';' --log-level DEBUG ./tests/simplest/data.csv:./tests/simplest/mapping.yaml"
+root = pathlib.Path(__file__).resolve().parent.parent
+simplest = root / "tests" / "simplest"
 
-    logging.debug(f"Run: {cmd}")
-    subprocess.run(cmd.split(), capture_output=True, check=True)
+# Arguments are kept as a list, so that paths containing spaces are passed as-is.
+args = [
+    "--biocypher-config", str(simplest / "biocypher_config.yaml"),
+    "--biocypher-schema", str(simplest / "schema_config.yaml"),
+    "--type-affix", "suffix",
+    "--type-affix-sep", ":",
+    "--prop-sep", ";",
+    "--log-level", "DEBUG",
+    f"{simplest / 'data.csv'}:{simplest / 'mapping.yaml'}",
+]
 
 
-def test_ontoweave_register():
-    logging.debug(f"From: {os.getcwd()}")
-    cmd="./src/tools/ontoweave --biocypher-config ./tests/simplest/biocypher_config.yaml --biocypher-schema ./tests/simplest/schema_config.yaml --type-affix suffix --type-affix-sep : --prop-sep ';' --log-level DEBUG ./tests/simplest/data.csv:./tests/simplest/mapping.yaml --register ./tests/test_ontoweave.py"
+def test_ontoweave(tmp_path):
+    # Run from a temporary directory, so that the BioCypher outputs of concurrent tests do not collide.
+    logging.debug("From: %s", tmp_path)
+    cmd = [str(root / "src" / "tools" / "ontoweave")] + args
 
-    logging.debug(f"Run: {cmd}")
-    subprocess.run(cmd.split(), capture_output=True, check=True)
+    logging.debug("Run: %s", cmd)
+    subprocess.run(cmd, capture_output=True, check=True, cwd=tmp_path)
 
 
+def test_ontoweave_register(tmp_path, monkeypatch):
+    # Run in-process, to avoid the start-up cost of a new interpreter.
+    monkeypatch.chdir(tmp_path)
 
-if __name__ == "__main__":
-    test_ontoweave()
+    # main() imports this file again as the `test_ontoweave` module
+    # and registers its transformers in the shared ontoweaver.transformer module.
+    # Setting then deleting the names records their current state (even if absent),
+    # so that it is restored at teardown and later tests are not affected.
+    monkeypatch.setitem(sys.modules, "test_ontoweave", None)
+    monkeypatch.delitem(sys.modules, "test_ontoweave", raising=False)
+    monkeypatch.setattr(ontoweaver.transformer, "user_transformer", None, raising=False)
+    monkeypatch.delattr(ontoweaver.transformer, "user_transformer", raising=False)
+
+    # main() also sets the level of its logger from --log-level.
+    logger = logging.getLogger("ontoweave")
+    level = logger.level
+
+    logging.debug("From: %s", tmp_path)
+    argv = args + ["--register", str(root / "tests" / "test_ontoweave.py")]
+
+    logging.debug("Run: ontoweave %s", argv)
+    try:
+        assert ontoweave.main(argv, appname="ontoweave") == 0
+    finally:
+        logger.setLevel(level)
@@ -1,7 +1,9 @@
-import logging
-
 import ontoweaver
 
+node_ids = frozenset({"1", "2"})
+node_labels = frozenset({"Source", "Target"})
+edge_ids = frozenset({"A", "B", "C"})
+
 def test_reconciliate():
     nodes = [
         ("1", "Source", {"p1":"z"}),
@@ -25,19 +27,16 @@ def test_reconciliate():
     for n in fnodes:
         assert("p1" in n[2]) # properties
         assert("p2" in n[2]) # properties
-        assert(n[0] in "12") # id
-        assert(n[1] in ["Source", "Target"]) # Label/type
-        logging.info(n)
+        assert(n[0] in node_ids) # id
+        assert(n[1] in node_labels) # Label/type
 
     for e in fedges:
         assert("q1" in e[4])
         assert("q2" in e[4])
         assert(e[3] == "Edge")
-        for l in e[0].split(";"):
-            assert(l in "ABC")
-        assert(e[1] in "12")
-        assert(e[2] in "12")
-        logging.info(e)
+        assert(edge_ids.issuperset(e[0].split(";")))
+        assert(e[1] in node_ids)
+        assert(e[2] in node_ids)
 
 
 if __name__ == "__main__":
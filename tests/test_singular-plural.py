@@ -1,66 +1,61 @@
 import logging
 import yaml
-import io
 import pandas as pd
 
 import ontoweaver
+from . import testing_functions
 
-def test_singular_plural():
-
-    logging.debug("Load data...")
+plural_mapping = """
+row:
+    map:
+        columns:
+            - Variant
+        to_subject: variant
+transformers:
+    - map:
+        columns:
+            - Patient
+        to_object: patient
+        via_relation: patient_has_variant
+    - map:
+        columns:
+            - Source
+        to_properties:
+            - source
+        for_objects:
+            - variant
+"""
 
-    # Do not add newlines or spaces here
-    # or else the parsing will be wrong.
-    data = """Patient,Variant,Source
-P1,V1-1,S0
-P1,V1-2,S1
-P2,V2-1,S2
-P2,V2-2,S3"""
-    csv = io.StringIO(data)
-    table = pd.read_csv(csv)
+singular_mapping = """
+row:
+    map:
+        column: Variant
+        to_subject: variant
+transformers:
+    - map:
+        column: Patient
+        to_object: patient
+        via_relation: patient_has_variant
+    - map:
+        column: Source
+        to_property: source
+        # Attach to subject by default.
+"""
 
-    logging.debug("Load mappings...")
+# Parse the mappings once, when the module is loaded.
+plural_map = yaml.load(plural_mapping, Loader=testing_functions.YamlLoader)
+singular_map = yaml.load(singular_mapping, Loader=testing_functions.YamlLoader)
 
-    plural_mapping = """
-    row:
-        map:
-            columns:
-                - Variant
-            to_subject: variant
-    transformers:
-        - map:
-            columns:
-                - Patient
-            to_object: patient
-            via_relation: patient_has_variant
-        - map:
-            columns:
-                - Source
-            to_properties:
-                - source
-            for_objects:
-                - variant
-    """
 
-    singular_mapping = """
-    row:
-        map:
-            column: Variant
-            to_subject: variant
-    transformers:
-        - map:
-            column: Patient
-            to_object: patient
-            via_relation: patient_has_variant
-        - map:
-            column: Source
-            to_property: source
-            # Attach to subject by default.
-    """
+def test_singular_plural():
 
-    plural_map = yaml.safe_load(plural_mapping)
-    singular_map = yaml.safe_load(singular_mapping)
+    logging.debug("Load data...")
 
+    table = pd.DataFrame({
+        "Patient": ["P1", "P1", "P2", "P2"],
+        "Variant": ["V1-1", "V1-2", "V2-1", "V2-2"],
+        "Source":  ["S0", "S1", "S2", "S3"],
+    })
 
     logging.debug("Run the plural adapter...")
     plural_adapter = ontoweaver.tabular.extract_table(table, plural_map, affix="none")
@@ -1,59 +1,55 @@
 import logging
 import yaml
-import io
 import pandas as pd
 
 import ontoweaver
+from . import testing_functions
+
+mapping = """
+row:
+    map:
+        columns:
+            - Variant
+        to_subject: variant
+transformers:
+    - map:
+        columns:
+            - Patient
+        to_object: patient
+        via_relation: patient_has_variant
+    - map:
+        columns:
+            - Source
+        to_properties:
+            - source
+        for_objects:
+            - patient
+            - variant
+    - string:
+        value: "Whatever it is"
+        to_properties:
+            - something
+        for_objects:
+            - patient
+            - variant
+"""
+
+# Parse the mapping once, when the module is loaded.
+transformer_map = yaml.load(mapping, Loader=testing_functions.YamlLoader)
+
 
 def test_transformer_string():
 
     logging.debug("Load data...")
 
-    # Do not add newlines or spaces here
-    # or else the parsing will be wrong.
-    data = """Patient,Variant,Source
-P1,V1-1,S0
-P1,V1-2,S1
-P2,V2-1,S2
-P2,V2-2,S3"""
-    csv = io.StringIO(data)
-    table = pd.read_csv(csv)
-
-    logging.debug("Load mappings...")
-
-    mapping = """
-    row:
-        map:
-            columns:
-                - Variant
-            to_subject: variant
-    transformers:
-        - map:
-            columns:
-                - Patient
-            to_object: patient
-            via_relation: patient_has_variant
-        - map:
-            columns:
-                - Source
-            to_properties:
-                - source
-            for_objects:
-                - patient
-                - variant
-        - string:
-            value: "Whatever it is"
-            to_properties:
-                - something
-            for_objects:
-                - patient
-                - variant
-    """
-
-    map = yaml.safe_load(mapping)
+    table = pd.DataFrame({
+        "Patient": ["P1", "P1", "P2", "P2"],
+        "Variant": ["V1-1", "V1-2", "V2-1", "V2-2"],
+        "Source":  ["S0", "S1", "S2", "S3"],
+    })
 
     logging.debug("Run the adapter...")
-    adapter = ontoweaver.tabular.extract_table(table, map, affix="none")
+    adapter = ontoweaver.tabular.extract_table(table, transformer_map, affix="none")
 
     for node in adapter.nodes:
         assert(node[2]["something"] == "Whatever it is")
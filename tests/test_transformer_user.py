@@ -1,8 +1,25 @@
 import logging
+import pathlib
 import yaml
-import pandas as pd
 
 import ontoweaver
+from . import testing_functions
+
+mapping = """
+row:
+    rowIndex:
+        to_subject: variant
+transformers:
+    - user_transformer:
+        columns:
+            - patient
+        to_object: patient
+        via_relation: patient_has_variant
+"""
+
+# Parse the mapping once, when the module is loaded.
+user_map = yaml.load(mapping, Loader=testing_functions.YamlLoader)
+
 
 class user_transformer(ontoweaver.base.Transformer):
     def __init__(self, target, properties_of, edge=None, columns=None, **kwargs):
@@ -12,34 +29,13 @@ class user_transformer(ontoweaver.base.Transformer):
         for key in self.columns:
             yield str(row[key])
 
-def test_transformer_user():
-    # Add the passed transformer to the list available to OntoWeaver.
-    ontoweaver.transformer.register(user_transformer)
-
-    directory_name = "simplest"
+# Add the passed transformer to the list available to OntoWeaver.
+ontoweaver.transformer.register(user_transformer)
 
-    logging.debug("Load mapping...")
-    yaml_mapping = """
-    row:
-        rowIndex:
-            to_subject: variant
-    transformers:
-        - user_transformer:
-            columns:
-                - patient
-            to_object: patient
-            via_relation: patient_has_variant
-    """
-
-    mapping = yaml.safe_load(yaml_mapping)
 
+def test_transformer_user(load_table):
     logging.debug("Load data...")
-    csv_file = "tests/" + directory_name + "/data.csv"
-    table = pd.read_csv(csv_file)
+    table = load_table(pathlib.Path("tests", "simplest", "data.csv"))
 
     logging.debug("Run the adapter...")
-    adapter = ontoweaver.tabular.extract_table(table, mapping, affix="none")
-
-
-if __name__ == "__main__":
-    test_transformer_user()
+    adapter = ontoweaver.tabular.extract_table(table, user_map, affix="none")
@@ -1,46 +1,41 @@
 import logging
+import pathlib
 import yaml
-import pandas as pd
 
 import ontoweaver
-
-def test_translate():
-
-    directory_name = "simplest"
-
-    logging.debug("Load mapping...")
-    yaml_mapping = """
-    row:
-        rowIndex:
-            to_subject: variant
-    transformers:
-        - translate:
-            columns:
-                - patient
-            to_object: patient
-            via_relation: patient_has_variant
-            translations:
-                A: a
-                B: b
-                C: c
-    """
-
-    mapping = yaml.safe_load(yaml_mapping)
-
+from . import testing_functions
+
+mapping = """
+row:
+    rowIndex:
+        to_subject: variant
+transformers:
+    - translate:
+        columns:
+            - patient
+        to_object: patient
+        via_relation: patient_has_variant
+        translations:
+            A: a
+            B: b
+            C: c
+"""
+
+# Parse the mapping once, when the module is loaded.
+translate_map = yaml.load(mapping, Loader=testing_functions.YamlLoader)
+
+
+def test_translate(load_table):
     logging.debug("Load data...")
-    csv_file = "tests/" + directory_name + "/data.csv"
-    table = pd.read_csv(csv_file)
+    table = load_table(pathlib.Path("tests", "simplest", "data.csv"))
 
     logging.debug("Run the adapter...")
-    adapter = ontoweaver.tabular.extract_table(table, mapping, affix="none")
+    adapter = ontoweaver.tabular.extract_table(table, translate_map, affix="none")
 
     assert(adapter)
-    assert(adapter.nodes)
-    assert(adapter.edges)
-
-    for n in adapter.nodes:
-        logging.info(n)
-
+    assert(list(adapter.edges))
 
-if __name__ == "__main__":
-    test_translate()
+    nodes = list(adapter.nodes)
+    assert(nodes)
+    for n in nodes:
+        assert(n[0].isnumeric() or n[0].islower())
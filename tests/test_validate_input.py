@@ -1,23 +1,22 @@
 import logging
-import subprocess
-import os
+import pathlib
 
-def test_validate_input():
-    logging.basicConfig(level=logging.DEBUG)
+import pytest
 
-    logging.debug(f"From: {os.getcwd()}")
-    cmd = "./src/tools/ontoweave ./tests/validate_input/data.csv:./tests/validate_input/mapping.yaml --validate-only"
+from tools import ontoweave
 
-    logging.debug(f"Run: {cmd}")
+root = pathlib.Path(__file__).resolve().parent.parent
 
-    result = subprocess.run(cmd.split(), capture_output=True, text=True, check=False)
 
-    # Check if the return code is 76 - indicating the validation has detected an error. This is the expected behavior,
-    # so test passes in this case.
-    if result.returncode == 76:
-        logging.info("Test passed: Command returned the expected exit code 76.")
-    else:
-        raise Exception(f"Test failed: Expected exit code 76 but got {result.returncode}.")
+def test_validate_input():
+    # Run in-process, to avoid the start-up cost of a new interpreter.
+    directory = root / "tests" / "validate_input"
+    # Arguments are kept as a list, so that paths containing spaces are passed as-is.
+    argv = [f"{directory / 'data.csv'}:{directory / 'mapping.yaml'}", "--validate-only"]
+    logging.debug("Run: ontoweave %s", argv)
 
-if __name__ == "__main__":
-    test_validate_input()
\ No newline at end of file
+    # The exit code 76 indicates that the validation has detected an error,
+    # which is the expected behavior.
+    with pytest.raises(SystemExit) as exited:
+        ontoweave.main(argv, appname="ontoweave")
+    assert exited.value.code == 76